@@ -10,8 +10,10 @@ from tkinterdnd2.TkinterDnD import DnDEvent
 # utils
 from utils.constants import WIDGET_MIN_WIDTH, WIDGET_MIN_HEIGHT, DEFAULT_FONT_FAMILY
 from utils.image import (
+    AISImage,
     ResizeDesc,
     calc_ssim,
+    is_obviously_dissimilar,
     ExportTarget,
 )
 from utils.duration_and_frame_rate import (
@@ -303,6 +305,9 @@ class VideoCaptureFrame(AISFrame, TkinterDnD.DnDWrapper):
         #   スライダーの内部表現としては小数点以下を整数として保持する（実質的に固定小数点）
         #   そのあたりのロジックは MultiscaleSequence で実装されている
         self._disable_dupe_values = MultiscaleSequence(5)
+        self._ssim_cache: dict[tuple[int, int], tuple[AISImage, AISImage, float]] = (
+            dict()
+        )
         self._disable_dupe_slider = AISSlider(
             self._input_kind_frame,
             None,
@@ -385,9 +390,7 @@ class VideoCaptureFrame(AISFrame, TkinterDnD.DnDWrapper):
         # グローバルホットキーを登録
         # NOTE
         #   K はキンキン！　の頭文字
-        self._model.global_hotkey.register(
-            "K", lambda: self._on_record_button_clicked()
-        )
+        self._model.global_hotkey.register("K", self._on_record_button_clicked)
 
         # ファイルドロップ関係
         self.drop_target_register(DND_FILES)
@@ -482,18 +485,15 @@ class VideoCaptureFrame(AISFrame, TkinterDnD.DnDWrapper):
         無効画像削除ボタンハンドラ
         """
         # 無効なフレームを列挙
-        disabled_frame_indices = []
-        for frame_index in range(self._model.video.num_total_frames):
-            if not self._model.video.get_enable(frame_index):
-                disabled_frame_indices.append(frame_index)
+        disabled_frame_indices = [
+            frame_index
+            for frame_index in range(self._model.video.num_total_frames)
+            if not self._model.video.get_enable(frame_index)
+        ]
 
-        # 無効なフレームを後ろから削除
-        # NOTE
-        #   前方のフレームを削除すると、それよりも後方のフレームがずれるので
-        disabled_frame_indices.sort(reverse=True)
+        # 無効なフレームをまとめて削除
         with VideoModelEditSession(self._model.video) as edit:
-            for disabled_frame_index in disabled_frame_indices:
-                edit.delete_frame(disabled_frame_index)
+            edit.delete_frames(disabled_frame_indices)
 
     def _on_enable_all_button_clicked(self):
         """
@@ -519,35 +519,63 @@ class VideoCaptureFrame(AISFrame, TkinterDnD.DnDWrapper):
         """
         重複無効化ボタンハンドラ
         """
-        # 全フレームの有効・無効を解決
+        # しきい値を解決
+        ddt = self._disable_dupe_values.to_uniform_float(
+            self._disable_dupe_slider.value
+        )
+
+        # SSIM キャッシュ
         # NOTE
-        #   全有効を初期値として、類似が見つかったら後ろ側のフレームを無効化する
-        frame_enabled = [True for _ in range(self._model.video.num_total_frames)]
-        for idx_B in range(1, self._model.video.num_total_frames):
-            # 前方に向かって有効フレームを探索
-            idx_A = idx_B - 1
-            while idx_A > 0:
-                if frame_enabled[idx_A]:
-                    break
-                idx_A -= 1
-
-            # 画像を取得（A）
-            image_A = self._model.video.get_frame(ImageLayer.NIME, idx_A)
-            if image_A is None:
-                raise TypeError()
+        #   しきい値を変えて何度も押されることが多いので、画像ペア毎の SSIM を使い回す。
+        #   今回のパスで使ったペアだけを次回に持ち越すことで、削除済みフレームのエントリは自然に消える。
+        #   id の再利用に備えて、画像インスタンスそのものも保持しておき、一致を確認する。
+        prev_ssim_cache = self._ssim_cache
+        self._ssim_cache = dict()
 
-            # 画像を取得（B）
-            image_B = self._model.video.get_frame(ImageLayer.NIME, idx_B)
-            if image_B is None:
+        # 全フレームの画像を先にまとめて取得
+        # NOTE
+        #   ループ内ではインデックスで直接参照するだけにする
+        frames: list[AISImage] = []
+        for frame in self._model.video.iter_frames(ImageLayer.NIME, False):
+            if frame is None:
                 raise TypeError()
+            frames.append(frame)
+
+        # 全フレームの有効・無効を解決
+        # NOTE
+        #   全有効を初期値として、類似が見つかったら後ろ側のフレームを無効化する
+        #   比較相手は直近の有効フレームなので、それを前から順に追跡する
+        frame_enabled = [True for _ in range(len(frames))]
+        idx_A = 0
+        for idx_B in range(1, len(frames)):
+            # 画像を取得
+            image_A = frames[idx_A]
+            image_B = frames[idx_B]
+
+            # 類似度を解決
+            cache_key = (id(image_A), id(image_B))
+            cache_entry = prev_ssim_cache.get(cache_key)
+            if (
+                cache_entry is not None
+                and cache_entry[0] is image_A
+                and cache_entry[1] is image_B
+            ):
+                similarity = cache_entry[2]
+            elif is_obviously_dissimilar(image_A, image_B, ddt):
+                # NOTE
+                #   SSIM の上界がしきい値に届かないなら SSIM 本体は計算しない。
+                #   上界はしきい値依存の判定にしか使えないので、キャッシュには載せない。
+                idx_A = idx_B
+                continue
+            else:
+                similarity = calc_ssim(image_A, image_B)
+            self._ssim_cache[cache_key] = (image_A, image_B, similarity)
 
             # 類似度を元に有効・無効を判定
-            similarity = calc_ssim(image_A, image_B)
-            ddt = self._disable_dupe_values.to_uniform_float(
-                self._disable_dupe_slider.value
-            )
             if similarity > ddt:
                 frame_enabled[idx_B] = False
+            else:
+                idx_A = idx_B
 
         # 解決した有効・無効をモデルに設定
         with VideoModelEditSession(self._model.video) as edit:
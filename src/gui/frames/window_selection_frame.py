@@ -1,6 +1,6 @@
 # std
-from typing import cast
 from dataclasses import dataclass
+import threading
 
 # Tk/CTk
 from tkinter import Event
@@ -9,8 +9,15 @@ from CTkListbox import CTkListbox
 
 # utils
 from utils.capture import *
-from utils.constants import DEFAULT_FONT_FAMILY, WIDGET_MIN_WIDTH, WIDGET_MIN_HEIGHT
+from utils.constants import (
+    DEFAULT_FONT_FAMILY,
+    WIDGET_MIN_WIDTH,
+    WIDGET_MIN_HEIGHT,
+    WINDOW_MIN_WIDTH,
+)
 from utils.ctk import show_notify_label
+from utils.image import ResizeDesc, Resolution
+from utils.metadata import AspectRatioPattern
 
 # gui
 from gui.widgets.still_label import StillLabel
@@ -37,6 +44,15 @@ class WindowSelectionFrame(AISFrame):
 
     UI_TAB_NAME = "構え"
 
+    # プレビュー用キャプチャ画像の最大サイズ
+    # NOTE
+    #   キャプチャ画像はプレビューにしか使わないので、フル解像度で保持する必要はない。
+    #   モデルに渡す前に縮小しておけば、リサイズのたびに読む画素数も減る。
+    PREVIEW_SOURCE_MAX_SIZE = 1024
+
+    # ウィンドウ列挙の完了ポーリング間隔
+    ENUMERATION_POLLING_MS = 20
+
     def __init__(
         self, master: ctk.CTkBaseClass, model: AynimeIssenStyleModel, **kwargs
     ):
@@ -57,8 +73,11 @@ class WindowSelectionFrame(AISFrame):
 
         # レイアウト設定
         self.ais.rowconfigure(1, weight=1)
-        self.ais.columnconfigure(0, weight=0, minsize=self.winfo_width() // 2)
-        self.ais.columnconfigure(1, weight=1, minsize=self.winfo_width() // 2)
+        # NOTE
+        #   この時点ではまだマップされていないので winfo_width は当てにならない。
+        #   ウィンドウの最小幅を左右で半分ずつ分け合う。
+        self.ais.columnconfigure(0, weight=0, minsize=WINDOW_MIN_WIDTH // 2)
+        self.ais.columnconfigure(1, weight=1, minsize=WINDOW_MIN_WIDTH // 2)
 
         # ウィンドウ一覧再読み込みボタン
         self._reload_capture_target_list_button = ctk.CTkButton(
@@ -72,6 +91,20 @@ class WindowSelectionFrame(AISFrame):
         self.ais.grid_child(self._reload_capture_target_list_button, 0, 0)
 
         # キャプチャ対象リストボックス
+        # NOTE
+        #   リストボックスに表示中のアイテムを _list_items に並び順のまま保持しておく
+        #   リストボックスには表示文字列だけを渡し、選択されたアイテムは _list_items から引く
+        self._list_items: list[WindowListBoxItem] = []
+        self._selected_item: WindowListBoxItem | None = None
+        self._is_restoring_selection = False
+
+        # ウィンドウリストの列挙状態
+        # NOTE
+        #   列挙中に更新が要求されたら、新しく列挙を始めずに要求があったことだけ覚えておく。
+        #   列挙が終わった時点で要求が残っていれば、もう一度だけ列挙し直す。
+        self._is_enumerating = False
+        self._is_update_list_requested = False
+
         self._capture_target_list_box = CTkListbox(self, multiple_selection=False)
         self.ais.grid_child(self._capture_target_list_box, 1, 0)
         self._capture_target_list_box.bind(
@@ -105,13 +138,17 @@ class WindowSelectionFrame(AISFrame):
         Args:
             event (_type_): イベントオブジェクト
         """
+        # リスト更新後の選択復元なら何もしない
+        # NOTE
+        #   キャプチャ対象は変わっていないので、キャプチャし直す必要はない
+        if self._is_restoring_selection:
+            return
+
         # キャプチャ対象の変更をモデルに反映
-        selection = cast(
-            WindowListBoxItem,
-            self._capture_target_list_box.get(
-                self._capture_target_list_box.curselection()
-            ),
-        )
+        # NOTE
+        #   選択中のアイテムとして覚えるのは、キャプチャ開始に成功してから。
+        #   失敗したものを覚えてしまうと、リスト更新時に選択が「復元」されて再試行されなくなる。
+        selection = self._list_items[self._capture_target_list_box.curselection()]
         try:
             self.model.stream.set_capture_window(selection.window_handle)
         except Exception as e:
@@ -121,10 +158,22 @@ class WindowSelectionFrame(AISFrame):
                 f'"{selection.window_name}" のキャプチャ開始に失敗',
                 exception=e,
             )
+            self._clear_selection()
+            return
+        self._selected_item = selection
 
         # 描画更新
+        preview_source_image = self.model.stream.capture_still().resize_contain(
+            ResizeDesc(
+                AspectRatioPattern.E_RAW,
+                Resolution(
+                    WindowSelectionFrame.PREVIEW_SOURCE_MAX_SIZE,
+                    WindowSelectionFrame.PREVIEW_SOURCE_MAX_SIZE,
+                ),
+            )
+        )
         with ImageModelEditSession(self.model.window_selection_image) as edit:
-            edit.set_raw_image(self.model.stream.capture_still())
+            edit.set_raw_image(preview_source_image)
 
         # フルサイズウィンドウ名ラベルを更新
         self._capture_target_full_name_label.configure(text=selection.window_name)
@@ -132,61 +181,200 @@ class WindowSelectionFrame(AISFrame):
     def update_list(self) -> None:
         """
         ウィンドウリストを更新する
+        ウィンドウの列挙はワーカースレッドで行い、完了したらリストに反映する。
+        列挙中に呼ばれた場合は、列挙完了後にもう一度だけ更新する。
         """
+        # 列挙中なら要求だけ覚えておく
+        # NOTE
+        #   タブ切り替えの度に呼ばれるので、列挙スレッドとポーリングが重複しないようにする
+        if self._is_enumerating:
+            self._is_update_list_requested = True
+            return
+
         try:
             # リスト更新ボタンを先に無効化
             self._reload_capture_target_list_button.configure(state=ctk.DISABLED)
 
-            # キャプチャ対象を未選択状態に戻す
-            self.model.stream.set_capture_window(None)
+            # 未選択なら、この時点で未選択状態の表示にしておく
+            # NOTE
+            #   選択中なら、列挙後に同じウィンドウが残っているかどうかで判断する
+            if self._selected_item is None:
+                self._clear_selection()
 
-            # プレビューをクリア
-            with ImageModelEditSession(self.model.window_selection_image) as edit:
-                edit.set_raw_image(None)
-            self._capture_target_full_name_label.configure(text="Window Full Name")
+            # ウィンドウリストの列挙を開始
+            # NOTE
+            #   ウィンドウ数が多いと Win32 API 呼び出しだけでそれなりに時間がかかる。
+            #   UI が固まらないようにワーカースレッドで列挙して、完了をポーリングで待つ。
+            enumeration_result: list[list[WindowListBoxItem]] = []
+            enumeration_thread = threading.Thread(
+                target=lambda: enumeration_result.append(
+                    WindowSelectionFrame._enumerate_list_items()
+                ),
+                name="_enumerate_list_items",
+                daemon=True,
+            )
+            enumeration_thread.start()
+            self._is_enumerating = True
+            self.after(
+                WindowSelectionFrame.ENUMERATION_POLLING_MS,
+                self._polling_enumeration,
+                enumeration_thread,
+                enumeration_result,
+            )
 
-            # リストをクリア
-            self._capture_target_list_box.delete("all")
+        except Exception:
+            # 失敗したらボタンを有効に戻す
+            self._reload_capture_target_list_button.configure(state=ctk.NORMAL)
+            raise
 
-            # ウィンドウリストを列挙
-            raw_items = [
-                WindowListBoxItem(window_handle, *get_nime_window_text(window_handle))
-                for window_handle in enumerate_windows()
-            ]
+    @staticmethod
+    def _enumerate_list_items() -> list[WindowListBoxItem]:
+        """
+        リストボックスに表示するアイテムを列挙する
+        ワーカースレッドから呼び出されるので、ウィジェットに触ってはいけない。
+        """
+        # ウィンドウリストを列挙
+        raw_items = [
+            WindowListBoxItem(window_handle, *get_nime_window_text(window_handle))
+            for window_handle in enumerate_windows()
+        ]
+
+        # 無名ウィンドウを除外
+        raw_items = [item for item in raw_items if item.window_name != ""]
+
+        # ソート
+        # NOTE
+        #   NIME を先頭に持ってくる
+        #   それ以外は ABC 順
+        nime_items = sorted(
+            [
+                WindowListBoxItem(
+                    item.window_handle, "★" + item.window_name, item.is_aynime
+                )
+                for item in raw_items
+                if item.is_aynime
+            ],
+            key=lambda item: item.window_name,
+        )
+        other_items = sorted(
+            [item for item in raw_items if not item.is_aynime],
+            key=lambda item: item.window_name,
+        )
 
-            # 無名ウィンドウを除外
-            raw_items = [item for item in raw_items if item.window_name != ""]
+        # 正常終了
+        return nime_items + other_items
 
-            # ソート
-            # NOTE
-            #   NIME を先頭に持ってくる
-            #   それ以外は ABC 順
-            nime_items = sorted(
-                [
-                    WindowListBoxItem(
-                        item.window_handle, "★" + item.window_name, item.is_aynime
-                    )
-                    for item in raw_items
-                    if item.is_aynime
-                ],
-                key=lambda item: item.window_name,
-            )
-            other_items = sorted(
-                [item for item in raw_items if not item.is_aynime],
-                key=lambda item: item.window_name,
+    def _polling_enumeration(
+        self,
+        enumeration_thread: threading.Thread,
+        enumeration_result: list[list[WindowListBoxItem]],
+    ) -> None:
+        """
+        ウィンドウリストの列挙完了を待って、リストに反映する
+        """
+        # 列挙中なら再度待つ
+        if enumeration_thread.is_alive():
+            self.after(
+                WindowSelectionFrame.ENUMERATION_POLLING_MS,
+                self._polling_enumeration,
+                enumeration_thread,
+                enumeration_result,
             )
-            for item in nime_items + other_items:
+            return
+
+        try:
+            # 列挙に失敗していたら何もしない
+            # NOTE
+            #   例外自体は threading.excepthook 経由でログに流れている
+            if len(enumeration_result) == 0:
+                return
+            new_items = enumeration_result[0]
+
+            # リストの選択を解除
+            # NOTE
+            #   選択中の要素が削除されうるので、差分更新の前に解除しておく
+            self._capture_target_list_box.deactivate("all")
+
+            # リストを差分更新
+            # NOTE
+            #   先頭から一致している部分はそのまま残し、それ以降だけを削除・追加する。
+            #   CTkListbox の delete("all") は要素ごとに update を呼ぶので、全削除・全追加は重い。
+            num_common_items = 0
+            for old_item, new_item in zip(self._list_items, new_items):
+                if old_item != new_item:
+                    break
+                num_common_items += 1
+            for index in reversed(range(num_common_items, len(self._list_items))):
+                self._capture_target_list_box.delete(index)
+            # NOTE
+            #   insert の第３引数 False で要素ごとの update を抑制して、最後に１回だけレイアウトを確定させる。
+            #   update だと溜まっているユーザー入力まで処理されてしまうので、 update_idletasks に留める。
+            for item in new_items[num_common_items:]:
                 self._capture_target_list_box.insert(
                     ctk.END,
-                    item,
+                    item.window_name,
                     False,
                 )
-            self._capture_target_list_box.update()
+            if num_common_items < max(len(self._list_items), len(new_items)):
+                self._capture_target_list_box.update_idletasks()
+            self._list_items = new_items
+
+            # 選択中だったウィンドウを探す
+            # NOTE
+            #   タイトルは変わりうるので、ウィンドウハンドルで同一性を判断する
+            restore_index = None
+            if self._selected_item is not None:
+                for index, item in enumerate(new_items):
+                    if item.window_handle == self._selected_item.window_handle:
+                        restore_index = index
+                        break
+
+            if restore_index is not None:
+                # 残っているなら選択状態だけ復元する
+                self._is_restoring_selection = True
+                try:
+                    self._capture_target_list_box.select(restore_index)
+                finally:
+                    self._is_restoring_selection = False
+                self._selected_item = new_items[restore_index]
+                self._capture_target_full_name_label.configure(
+                    text=self._selected_item.window_name
+                )
+            else:
+                # 残っていないなら未選択状態に戻す
+                if self._selected_item is not None:
+                    self._clear_selection()
 
-            # NIME があるならそれを自動選択
-            if len(nime_items) > 0:
-                self._capture_target_list_box.select(0)
+                # NIME があるならそれを自動選択
+                if len(new_items) > 0 and new_items[0].is_aynime:
+                    self._capture_target_list_box.select(0)
 
         finally:
-            # 必ず最後にボタンを有効に戻す
-            self._reload_capture_target_list_button.configure(state=ctk.NORMAL)
+            # 列挙完了
+            self._is_enumerating = False
+
+            # 列挙中に更新要求があったなら、もう一度列挙する
+            # NOTE
+            #   ボタンは無効のまま、次の列挙の完了時に有効に戻す
+            if self._is_update_list_requested:
+                self._is_update_list_requested = False
+                self.update_list()
+            else:
+                # 必ず最後にボタンを有効に戻す
+                self._reload_capture_target_list_button.configure(state=ctk.NORMAL)
+
+    def _clear_selection(self) -> None:
+        """
+        キャプチャ対象を未選択状態に戻す
+        """
+        # キャプチャ対象を未選択状態に戻す
+        self.model.stream.set_capture_window(None)
+        self._selected_item = None
+
+        # プレビューをクリア
+        with ImageModelEditSession(self.model.window_selection_image) as edit:
+            edit.set_raw_image(None)
+        self._capture_target_full_name_label.configure(text="Window Full Name")
+
+        # リストの選択を解除
+        self._capture_target_list_box.deactivate("all")
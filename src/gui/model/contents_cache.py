@@ -24,7 +24,6 @@ from PIL import (
     Image,
     ImageDraw,
     ImageFont,
-    ImageEnhance,
     ImageFilter,
 )
 
@@ -328,6 +327,8 @@ class CachedScalableImage(CachedContent):
         parent: CachedContent,
         resize_mode: ResizeMode,
         aux_process: AuxProcess | None = None,
+        resample: Image.Resampling = Image.Resampling.LANCZOS,
+        keeps_prev_output: bool = False,
     ):
         """
         コンストラクタ
@@ -338,11 +339,23 @@ class CachedScalableImage(CachedContent):
         # 定数
         self._resize_mode = resize_mode
         self._aux_process = aux_process
+        self._resample = resample
+        self._keeps_prev_output = keeps_prev_output and aux_process is None
 
         # 遅延変数
         self._size = ResizeDesc(AspectRatioPattern.E_RAW, ResolutionPattern.E_RAW)
         self._output = None
 
+        # ひとつ前の出力
+        # NOTE
+        #   レイアウトが落ち着くまでの間、サイズは A → B → A のように行ったり来たりしがち。
+        #   直前の出力をひとつだけ残しておいて、条件が一致すればリサイズせずに再利用する。
+        #   aux_process は外部状態に依存しうるので、 aux_process が無い場合だけ対象とする。
+        #   出力を２枚抱えることになるので、 keeps_prev_output を指定したレイヤーだけで有効。
+        self._output_key: tuple[AISImage, ResizeDesc, ResizeMode] | None = None
+        self._prev_output_key: tuple[AISImage, ResizeDesc, ResizeMode] | None = None
+        self._prev_output: AISImage | None = None
+
     def set_size(self, size: ResizeDesc) -> Self:
         """
         スケーリング後のサイズを設定
@@ -387,21 +400,58 @@ class CachedScalableImage(CachedContent):
             parent_output = self.parent_output
             if parent_output is not None and self._size is not None:
                 # 揃っている場合、更新
-                if isinstance(parent_output, AISImage):
-                    self._output = parent_output.resize(self._size, self._resize_mode)
-                else:
+                if not isinstance(parent_output, AISImage):
                     raise TypeError(type(parent_output))
-                if self._aux_process is not None:
-                    self._output = self._aux_process(self._output)
+                new_key = (parent_output, self._size, self._resize_mode)
+                if not self._keeps_prev_output:
+                    # ひとつ前の出力を残さない場合、単にリサイズ
+                    self._output = parent_output.resize(
+                        self._size, self._resize_mode, self._resample
+                    )
+                    if self._aux_process is not None:
+                        self._output = self._aux_process(self._output)
+                elif self._is_same_key(new_key, self._prev_output_key):
+                    # ひとつ前の出力と条件が一致するなら、それと入れ替える
+                    self._output, self._prev_output = self._prev_output, self._output
+                    self._output_key, self._prev_output_key = (
+                        self._prev_output_key,
+                        self._output_key,
+                    )
+                else:
+                    # 一致しないならリサイズして、今の出力をひとつ前の出力として残す
+                    self._prev_output = self._output
+                    self._prev_output_key = self._output_key
+                    self._output = parent_output.resize(
+                        self._size, self._resize_mode, self._resample
+                    )
+                    self._output_key = new_key
                 self.mark_resolved()
             else:
                 # 揃っていない場合、単にクリア
+                # NOTE
+                #   キーだけ残すと、後で None の出力と入れ替わってしまうので、全部まとめてクリア
                 self._output = None
+                self._output_key = None
+                self._prev_output = None
+                self._prev_output_key = None
                 self.mark_resolved()
 
         # 正常終了
         return self._output
 
+    @staticmethod
+    def _is_same_key(
+        key_A: tuple[AISImage, ResizeDesc, ResizeMode] | None,
+        key_B: tuple[AISImage, ResizeDesc, ResizeMode] | None,
+    ) -> bool:
+        """
+        出力の条件 key_A, key_B が一致するなら True
+        画像の一致はオブジェクト ID で判定される。
+        """
+        if key_A is None or key_B is None:
+            return False
+        return key_A[0] == key_B[0] and key_A[1] == key_B[1] and key_A[2] == key_B[2]
+
 
 class ImageLayer(Enum):
     """
@@ -447,29 +497,31 @@ def make_disabled_image(
     Returns:
         AISImage: 無効っぽい見た目の画像
     """
-    # エイリアス
-    source_pil_image = source_image.pil_image
-
-    # 輝度を割合で下げる
-    enhancer = ImageEnhance.Brightness(source_pil_image.convert("RGBA"))
-    dark_image = enhancer.enhance(darkness)
+    # 定数
+    OVERLAY_ALPHA = 120
 
-    # 黒画像を半透明合成して更に暗くする
-    w, h = dark_image.size
-    overlay = Image.new("RGBA", (w, h), (0, 0, 0, 120))
-    dark_image.alpha_composite(overlay)
+    # 輝度を割合で下げ、黒画像を半透明合成して更に暗くする
+    # NOTE
+    #   どちらも画素値の定数倍なので、１つの倍率にまとめて ndarray 上で１パスで処理する。
+    #   倍率は 8bit 固定小数点で表現して整数演算だけで済ませる。
+    scale = darkness * (255 - OVERLAY_ALPHA) / 255
+    scale_q8 = round(scale * 256)
+    np_image = np.asarray(source_image.pil_image.convert("RGB"), dtype=np.uint8)
+    np_image = ((np_image.astype(np.uint16) * scale_q8) >> 8).astype(np.uint8)
+    dark_image = Image.fromarray(np_image, "RGB")
 
     # テキストを描画
+    w, h = dark_image.size
     font = FontCache.query(h / 8)
     tw, th = get_text_bbox_size(dark_image.size, text, font)
     center_w = (w - tw) / 2
     center_h = (h - th) / 2
     center_pos = (center_w, center_h)
     draw = ImageDraw.Draw(dark_image)
-    draw.text(center_pos, text, font=font, fill=(255, 255, 255, 230))
+    draw.text(center_pos, text, font=font, fill=(255, 255, 255))
 
     # 正常終了
-    return AISImage(dark_image.convert("RGB"))
+    return AISImage(dark_image)
 
 
 def pil_to_np(pil_image: Image.Image) -> np.ndarray:
@@ -542,8 +594,10 @@ def overlay_nime_name(source_image: AISImage, nime_name: str | None) -> AISImage
     source_image に nime_name をオーバーレイする。
     """
     # 名前が無い場合は何もしない
+    # NOTE
+    #   AISImage の中身に対する in-place 処理は禁止なので、コピーを取らずにそのまま返す
     if nime_name is None:
-        return AISImage(source_image.pil_image.copy())
+        return source_image
 
     # フォントサイズを決定
     # NOTE
@@ -552,7 +606,7 @@ def overlay_nime_name(source_image: AISImage, nime_name: str | None) -> AISImage
     MIN_FONT_SIZE = 10
     font_size = source_image.height // FONT_SCALE_DEN
     if font_size < MIN_FONT_SIZE:
-        return AISImage(source_image.pil_image.copy())
+        return source_image
 
     # 構築先画像
     result_image = source_image.pil_image.convert("RGB")
@@ -769,7 +823,15 @@ class ImageModel:
             ResizeMode.COVER if nime_resize_mode is None else nime_resize_mode,
             aux_process=self._aux_process_nime,
         )
-        self._preview_image = CachedScalableImage(self._nime_image, ResizeMode.CONTAIN)
+        # NOTE
+        #   プレビューは表示サイズが頻繁に変わるうえ、画質はそこまで求められないので BILINEAR で十分
+        #   サイズが行ったり来たりするのもプレビューなので、ひとつ前の出力を残すのはここだけ
+        self._preview_image = CachedScalableImage(
+            self._nime_image,
+            ResizeMode.CONTAIN,
+            resample=Image.Resampling.BILINEAR,
+            keeps_prev_output=True,
+        )
         self._thumbnail_image_enable = CachedScalableImage(
             self._nime_image, ResizeMode.COVER
         )
@@ -1225,6 +1287,12 @@ class VideoModel:
         self._global_model = ImageModel(nime_resize_mode=nime_resize_mode)
         self._frames: list[ImageModel] = []
 
+        # 無効フレーム数
+        # NOTE
+        #   有効フレーム数は再生中に毎フレーム参照されるので、都度数えずにここで追跡する
+        #   フレームの追加・削除・有効無効の切り替えのたびに VideoModelEditSession が更新する
+        self._num_disable_frames = 0
+
         # 再生時の更新間隔
         self._duration_in_msec = DFR_MAP.default_entry.duration_in_msec
         self._duration_is_dirty = False
@@ -1299,7 +1367,7 @@ class VideoModel:
         Returns:
             int: 有効なフレーム数
         """
-        return len([f for f in self._frames if f.enable])
+        return len(self._frames) - self._num_disable_frames
 
     def iter_frames(
         self, layer: ImageLayer, enable_only: bool
@@ -1510,6 +1578,12 @@ class VideoModelEditSession:
         """
         model = self._model
         if frame_indices is None:
+            # NOTE
+            #   全フレームがすでに指定状態なら何もしなくて良い
+            if enable and model._num_disable_frames == 0:
+                return self
+            elif not enable and model._num_disable_frames == len(model._frames):
+                return self
             return self.set_enable_batch(
                 [(frame_index, enable) for frame_index in range(len(model._frames))]
             )
@@ -1538,6 +1612,7 @@ class VideoModelEditSession:
                 does_change = True
                 with ImageModelEditSession(frame, _does_notify=False) as e:
                     e.set_enable(enable)
+                model._num_disable_frames += -1 if enable else 1
 
         # グローバルモデルに状態を反映
         # NOTE
@@ -1653,6 +1728,8 @@ class VideoModelEditSession:
                 e.set_time_stamp(model._global_model.time_stamp)
                 e.set_nime_name(model._global_model.nime_name)
                 model._frames.append(new_obj)
+                if not new_obj.enable:
+                    model._num_disable_frames += 1
         else:
             # ImageModel ではない場合、 ImageModel の呼び出しに変換
             if isinstance(new_obj, Iterable):
@@ -1689,7 +1766,39 @@ class VideoModelEditSession:
         model = self._model
 
         # 指定フレームを削除
-        model._frames.pop(position)
+        removal_frame = model._frames.pop(position)
+        if not removal_frame.enable:
+            model._num_disable_frames -= 1
+
+        # グローバルモデルに状態を反映
+        with ImageModelEditSession(model._global_model, _does_notify=False) as e:
+            e.set_raw_image(AISImage.empty())
+
+        # 正常終了
+        return self
+
+    def delete_frames(self, positions: Iterable[int]) -> Self:
+        """
+        指定インデックスのフレームをまとめて削除する
+        インデックスは削除前のものとして解釈される。
+        """
+        # エイリアス
+        model = self._model
+
+        # 削除対象が無ければ何もしない
+        removal_positions = set(positions)
+        if len(removal_positions) == 0:
+            return self
+
+        # 指定フレームを削除
+        # NOTE
+        #   １フレームずつ pop すると後続要素の詰め直しが毎回発生するので、１パスで作り直す
+        model._frames = [
+            frame
+            for frame_index, frame in enumerate(model._frames)
+            if frame_index not in removal_positions
+        ]
+        model._num_disable_frames = len([f for f in model._frames if not f.enable])
 
         # グローバルモデルに状態を反映
         with ImageModelEditSession(model._global_model, _does_notify=False) as e:
@@ -1707,6 +1816,7 @@ class VideoModelEditSession:
 
         # 全フレームを削除
         model._frames.clear()
+        model._num_disable_frames = 0
 
         # グローバルモデルに状態を反映
         with ImageModelEditSession(model._global_model, _does_notify=False) as e:
@@ -1,6 +1,6 @@
 # std
 from typing import Callable
-import time
+from time import perf_counter
 
 # ctk
 import customtkinter as ctk
@@ -53,16 +53,23 @@ class AISEntry(ctk.CTkEntry):
         テキスト変更ポーリング関数
         変更が発生した後少ししてからモデルに反映する
         """
+        # 現在の状態を取得
+        # NOTE
+        #   text は Tk への問い合わせになるので、１回のポーリングで１回だけ取る
+        #   時刻はシステム時計の変更に影響されない perf_counter で測る
+        current_text = self.text
+        now = perf_counter()
+
         # 変更内容に変更があった場合は、モデル適用時刻を更新
-        if self.text != self._polled_value:
-            self._polled_value = self.text
-            self._next_notify_time = time.time() + 0.5
+        if current_text != self._polled_value:
+            self._polled_value = current_text
+            self._next_notify_time = now + 0.5
 
         # 予定時刻を過ぎたら通知
-        if self._next_notify_time is not None and time.time() > self._next_notify_time:
+        if self._next_notify_time is not None and now > self._next_notify_time:
             self._next_notify_time = None
             for handler in self._handlers:
-                handler(self.text)
+                handler(current_text)
 
         # 次のポーリング
         self.after(100, self._poll_edit)
@@ -1,9 +1,12 @@
 # TK/CTk
 import customtkinter as ctk
+from tkinter import Event
+
+# PIL
+from PIL.ImageTk import PhotoImage
 
 # utils
-from utils.constants import DEFAULT_FONT_FAMILY
-from utils.ctk import silent_configure, configure_presence
+from utils.ctk import silent_configure, configure_presence, get_default_font
 from utils.image import ResizeDesc, Resolution, AISImage
 
 # model
@@ -17,6 +20,11 @@ class StillLabel(ctk.CTkLabel):
     設定された画像をアスペクト比を維持したまま全体が映るようにダウンスケールして表示する
     """
 
+    # リサイズ反映の遅延時間
+    # NOTE
+    #   ウィンドウのドラッグ中は <Configure> が大量に発火するので、最後のイベントだけを反映する
+    RESIZE_DEBOUNCE_MS = 40
+
     def __init__(
         self,
         master: ctk.CTkBaseClass,
@@ -35,6 +43,19 @@ class StillLabel(ctk.CTkLabel):
         #   そのため、この階層でキャッシュ情報を保持しておく
         self._current_frame = None
 
+        # 表示に使い回す PhotoImage
+        # NOTE
+        #   同じサイズ・モードの画像が続く限り、新しい PhotoImage は作らずに paste で中身だけ差し替える。
+        #   Tk 側の画像バッファの確保・破棄と、ラベルへの configure を省略できる。
+        self._photo_image: PhotoImage | None = None
+        self._photo_image_mode: str | None = None
+
+        # 最後にモデルに反映したサイズ
+        self._last_size: tuple[int, int] | None = None
+
+        # 反映待ちのサイズ変更
+        self._resize_after_id: str | None = None
+
         # モデル関係
         self._image_model = image_model
         self._image_model.register_layer_changed_handler(
@@ -42,8 +63,7 @@ class StillLabel(ctk.CTkLabel):
         )
 
         # フォントを設定
-        default_font = ctk.CTkFont(DEFAULT_FONT_FAMILY)
-        silent_configure(self, font=default_font)
+        silent_configure(self, font=get_default_font())
 
         # ブランク表示
         self._blank_text = blank_text
@@ -60,7 +80,21 @@ class StillLabel(ctk.CTkLabel):
         new_frame = self._image_model.get_image(ImageLayer.PREVIEW)
         if new_frame != self._current_frame:
             if isinstance(new_frame, AISImage):
-                configure_presence(self, new_frame.photo_image)
+                pil_image = new_frame.pil_image
+                if (
+                    self._current_frame is not None
+                    and self._photo_image is not None
+                    and self._photo_image.width() == pil_image.width
+                    and self._photo_image.height() == pil_image.height
+                    and self._photo_image_mode == pil_image.mode
+                ):
+                    # 表示中の PhotoImage に上書き
+                    self._photo_image.paste(pil_image)
+                else:
+                    # PhotoImage を作り直して表示
+                    self._photo_image = PhotoImage(pil_image)
+                    self._photo_image_mode = pil_image.mode
+                    configure_presence(self, self._photo_image)
                 self._current_frame = new_frame
             else:
                 configure_presence(self, self._blank_text)
@@ -70,9 +104,38 @@ class StillLabel(ctk.CTkLabel):
         """
         リサイズハンドラ
         """
-        # モデルにサイズを反映
+        # 反映を遅延実行
+        # NOTE
+        #   反映待ちのものがあればキャンセルして、最後のイベントから一定時間後に反映する
+        #   イベントは反映のきっかけとしてだけ使い、サイズは反映時にウィジェットから取る。
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.after(
+            StillLabel.RESIZE_DEBOUNCE_MS, self._apply_pending_size
+        )
+
+    def _apply_pending_size(self):
+        """
+        反映待ちのサイズをモデルに反映する
+        """
+        # 反映待ちを解除
+        self._resize_after_id = None
+
+        # ウィジェット自身のサイズを取得
+        # NOTE
+        #   CTkLabel の bind は内部の Canvas と Label の両方に掛かる。
+        #   内部の Label は文字列・画像の大きさにしかならないので、イベントのサイズは信用できない。
         actual_width = self.winfo_width()
         actual_height = self.winfo_height()
+
+        # サイズが変わっていないなら何もしない
+        # NOTE
+        #   <Configure> はサイズ以外（位置など）の変更でも発火する
+        if (actual_width, actual_height) == self._last_size:
+            return
+        self._last_size = (actual_width, actual_height)
+
+        # モデルにサイズを反映
         with ImageModelEditSession(self._image_model) as edit:
             edit.set_size(
                 ImageLayer.PREVIEW,
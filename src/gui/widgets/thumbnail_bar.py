@@ -3,8 +3,7 @@ from tkinter import Event
 import customtkinter as ctk
 
 # utils
-from utils.constants import DEFAULT_FONT_FAMILY
-from utils.ctk import configure_presence
+from utils.ctk import configure_presence, silent_configure, get_default_font
 from utils.image import AISImage, Resolution
 
 # gui
@@ -36,9 +35,6 @@ class SentinelItem(ctk.CTkFrame):
         """
         super().__init__(master)
 
-        # フォントを生成
-        default_font = ctk.CTkFont(DEFAULT_FONT_FAMILY)
-
         # 引数を保存
         self._model = model
 
@@ -51,7 +47,7 @@ class SentinelItem(ctk.CTkFrame):
             self,
             text="Drop image file(s) HERE",
             bg_color="transparent",
-            font=default_font,
+            font=get_default_font(),
             padx=THUMBNAIL_KIND_PADDING,
             pady=THUMBNAIL_KIND_PADDING,
         )
@@ -88,16 +84,19 @@ class ThumbnailItem(ctk.CTkFrame):
     """
 
     def __init__(
-        self, master: "ThumbnailBar", model: AynimeIssenStyleModel, frame_index: int
+        self,
+        master: "ThumbnailBar",
+        model: AynimeIssenStyleModel,
+        frame_index: int,
+        placeholder_width: int = 0,
     ):
         """
         コンストラクタ
+        サムネイル画像は update_image が呼ばれるまで生成されない。
+        それまでは placeholder_width の幅の空ラベルとして振る舞う。
         """
         super().__init__(master)
 
-        # フォントを生成
-        default_font = ctk.CTkFont(DEFAULT_FONT_FAMILY)
-
         # 現在表示している画像
         # NOTE
         #   現在表示している AISImage のインスタンスをウィジェットから取ることはできない。
@@ -109,24 +108,21 @@ class ThumbnailItem(ctk.CTkFrame):
         self._model = model
         self._frame_index = frame_index
 
-        # プレビュー用画像を取得
-        thumbnail_image = self._model.video.get_frame(
-            ImageLayer.THUMBNAIL, self._frame_index
-        )
-        if not isinstance(thumbnail_image, AISImage):
-            raise TypeError()
-
         # クリック操作受付用のボタン
         # NOTE
         #   tk.Canvas のサイズ上限回避のために、パディングもケチる。
+        # NOTE
+        #   サムネイル画像の生成（リサイズ・PhotoImage 化）は表示範囲に入るまで遅延する。
+        #   それまでの間、レイアウトが大きく崩れないように幅だけ確保しておく。
         self._button = ctk.CTkLabel(
             self,
+            width=placeholder_width,
+            text="",
             fg_color="transparent",
-            font=default_font,
+            font=get_default_font(),
             padx=THUMBNAIL_KIND_PADDING,
             pady=THUMBNAIL_KIND_PADDING,
         )
-        configure_presence(self._button, thumbnail_image.photo_image)
         self._button.pack(
             fill="both",
             expand=True,
@@ -146,11 +142,26 @@ class ThumbnailItem(ctk.CTkFrame):
         new_frame = self._model.video.get_frame(ImageLayer.THUMBNAIL, self._frame_index)
         if new_frame != self._current_frame:
             if isinstance(new_frame, AISImage):
+                if self._current_frame is None:
+                    # NOTE
+                    #   プレースホルダーとしての幅指定を解除して、画像サイズに追従させる
+                    silent_configure(self._button, width=0)
                 configure_presence(self._button, new_frame.photo_image)
                 self._current_frame = new_frame
             else:
                 raise TypeError()
 
+    @property
+    def thumbnail_width(self) -> int | None:
+        """
+        現在表示しているサムネイル画像の横幅
+        まだ画像を表示していない場合は None
+        """
+        if self._current_frame is None:
+            return None
+        else:
+            return self._current_frame.width
+
     def _on_click_left(self, event: Event):
         """
         マウスクリック（左ボタン）
@@ -170,6 +181,13 @@ class ThumbnailItem(ctk.CTkFrame):
 class ThumbnailBar(ctk.CTkScrollableFrame):
     """
     画像（アイテム）サムネイルを横並びでリスト表示可能なウィジェット
+    NOTE
+        サムネイル画像の生成・更新は、表示範囲内のアイテムに対してだけ行う。
+        そのため、モデルに変更があっても、範囲外のアイテムは古い画像（有効・無効の表示を含む）のままになる。
+        範囲内に入った時点で最新の状態に更新される。
+    NOTE
+        表示範囲の変化を拾うため、 CTkScrollableFrame 内部の _parent_canvas の xscrollcommand を差し替えている。
+        CTk の非公開属性に依存しているので、 CTk の更新時には動作を確認すること。
     """
 
     def __init__(
@@ -199,6 +217,8 @@ class ThumbnailBar(ctk.CTkScrollableFrame):
 
         # 内部状態
         self._items: list[ThumbnailItem] = []
+        self._placeholder_width = 0
+        self._is_visible_update_pending = False
 
         # 高さ方向はいっぱいまで拡大
         self.grid_rowconfigure(0, weight=1)
@@ -227,6 +247,11 @@ class ThumbnailBar(ctk.CTkScrollableFrame):
         self._parent_canvas.bind("<Enter>", self._mouse_enter)
         self._parent_canvas.bind("<Leave>", self._mouse_leave)
 
+        # 表示範囲の変化をフック
+        # NOTE
+        #   スクロール・リサイズ・中身の増減のいずれでも xscrollcommand が呼び出される
+        self._parent_canvas.configure(xscrollcommand=self._on_xscroll)
+
         # コールバック設定
         self._model.video.register_layer_changed_handler(
             ImageLayer.THUMBNAIL, self._on_thumbnail_change
@@ -237,16 +262,26 @@ class ThumbnailBar(ctk.CTkScrollableFrame):
         動画に変更があった時に呼び出されるハンドラ
         """
         # UI 上とモデル上とでフレーム数をあわせる（ウィジェット削除）
-        while len(self._items) > self._model.video.num_total_frames:
-            self._items[-1].destroy()
-            self._items.pop()
+        # NOTE
+        #   削除対象は末尾にまとめて存在するので、スライスで一括して切り離してから破棄する。
+        num_total_frames = self._model.video.num_total_frames
+        if len(self._items) > num_total_frames:
+            removal_items = self._items[num_total_frames:]
+            del self._items[num_total_frames:]
+            for removal_item in removal_items:
+                removal_item.destroy()
 
         # UI 上とモデル上とでフレーム数をあわせる（ウィジェット追加）
         # NOTE
         #   tk.Canvas のサイズ上限回避のために、パディングもケチる。
         while len(self._items) < self._model.video.num_total_frames:
             new_column = len(self._items)
-            new_item = ThumbnailItem(self, self._model, len(self._items))
+            new_item = ThumbnailItem(
+                self,
+                self._model,
+                len(self._items),
+                round(self._placeholder_width / self._get_widget_scaling()),
+            )
             new_item.grid(
                 row=0,
                 column=new_column,
@@ -272,9 +307,61 @@ class ThumbnailBar(ctk.CTkScrollableFrame):
             )
             self.grid_columnconfigure(new_sentinel_column, pad=THUMBNAIL_KIND_PADDING)
 
-        # 全ウィジェットの表示を更新
+        # 表示範囲内のウィジェットの表示を更新
+        self._request_visible_update()
+
+    def _on_xscroll(self, first: str, last: str):
+        """
+        表示範囲が変化した時に呼び出されるハンドラ
+        """
+        self._scrollbar.set(first, last)
+        self._request_visible_update()
+
+    def _request_visible_update(self):
+        """
+        表示範囲内のアイテムの更新を予約する
+        NOTE
+            イベントが連続しても、アイドル時に１回だけ更新する
+        """
+        if not self._is_visible_update_pending:
+            self._is_visible_update_pending = True
+            self.after_idle(self._update_visible_items)
+
+    def _update_visible_items(self):
+        """
+        表示範囲内のアイテムだけ表示を更新する
+        範囲外のアイテムは、範囲内に入った時点で更新される。
+        """
+        # 予約を解除
+        self._is_visible_update_pending = False
+
+        # 表示範囲を解決
+        # NOTE
+        #   xview は内部フレーム全体に対する割合なので、内部フレームの座標系に変換する
+        first, last = self._parent_canvas.xview()
+        total_width = self.winfo_width()
+        view_left = first * total_width
+        view_right = last * total_width
+
+        # 表示範囲内のアイテムを更新
+        # NOTE
+        #   アイテムは左から順に並んでいるので、範囲の右端を越えたら打ち切り
+        #   追加直後でまだ配置されていないアイテムは飛ばす。
+        #   配置が決まると内部フレームのサイズが変わって xscrollcommand が呼ばれるので、そこで拾われる。
+        #   ここで update_idletasks してしまうと、その xscrollcommand で更新が再予約されるうえ、
+        #   他の保留中のアイドル処理まで巻き込んでしまう。
         for item in self._items:
+            if not item.winfo_ismapped():
+                continue
+            item_left = item.winfo_x()
+            if item_left > view_right:
+                break
+            if item_left + item.winfo_width() < view_left:
+                continue
             item.update_image()
+            thumbnail_width = item.thumbnail_width
+            if thumbnail_width is not None:
+                self._placeholder_width = thumbnail_width
 
     def _mouse_enter(self, _):
         """
@@ -63,61 +63,68 @@ class VideoLabel(ctk.CTkLabel):
         """
         表示状態を次のフレームに進めるハンドラ
         """
+        # エイリアス
+        # NOTE
+        #   再生中は毎フレーム呼ばれるので、何度も参照するものはローカルに束縛しておく
+        video_model = self._video_model
+        num_enable_frames = video_model.num_enable_frames
+        num_total_frames = video_model.num_total_frames
+        get_enable = video_model.get_enable
+
         # 表示フレーム番号を解決
-        if self._video_model.num_enable_frames == 0:
+        if num_enable_frames == 0:
             # 表示すべきフレームが無い場合は None
             self._frame_index = None
 
-        elif self._video_model.num_enable_frames == 1:
+        elif num_enable_frames == 1:
             # １フレームだけの場合、唯一の有効フレームを特定
-            for i in range(self._video_model.num_total_frames):
-                if self._video_model.get_enable(i):
+            for i in range(num_total_frames):
+                if get_enable(i):
                     self._frame_index = i
                     break
 
-        elif self._video_model.num_enable_frames > 1:
+        elif num_enable_frames > 1:
             # ２フレーム以上なら、通常のフレーム進行
 
             # フレーム番号が None なら 0 初期化
-            if self._frame_index is None:
-                self._frame_index = 0
+            frame_index = 0 if self._frame_index is None else self._frame_index
+            playback_mode = video_model.playback_mode
 
             # 次の有効フレームまでシーク
             while True:
                 # １フレームだけシーク
-                match self._video_model.playback_mode:
+                match playback_mode:
                     case PlaybackMode.FORWARD:
-                        self._frame_index += 1
-                        if self._frame_index < 0:
-                            self._frame_index = 0
-                        elif self._frame_index >= self._video_model.num_total_frames:
-                            self._frame_index = 0
+                        frame_index += 1
+                        if frame_index < 0:
+                            frame_index = 0
+                        elif frame_index >= num_total_frames:
+                            frame_index = 0
                     case PlaybackMode.BACKWARD:
-                        self._frame_index -= 1
-                        if self._frame_index < 0:
-                            self._frame_index = self._video_model.num_total_frames - 1
-                        elif self._frame_index >= self._video_model.num_total_frames:
-                            self._frame_index = self._video_model.num_total_frames - 1
+                        frame_index -= 1
+                        if frame_index < 0:
+                            frame_index = num_total_frames - 1
+                        elif frame_index >= num_total_frames:
+                            frame_index = num_total_frames - 1
                     case PlaybackMode.REFLECT:
-                        self._frame_index += self._reflect_seek_direction
-                        if self._frame_index < 0:
-                            self._frame_index = 1
+                        frame_index += self._reflect_seek_direction
+                        if frame_index < 0:
+                            frame_index = 1
                             self._reflect_seek_direction = 1
-                        elif self._frame_index >= self._video_model.num_total_frames:
-                            self._frame_index = self._video_model.num_total_frames - 2
+                        elif frame_index >= num_total_frames:
+                            frame_index = num_total_frames - 2
                             self._reflect_seek_direction = -1
 
                 # 有効フレームなら、ここで決定
-                if self._video_model.get_enable(self._frame_index):
+                if get_enable(frame_index):
                     break
+            self._frame_index = frame_index
 
         # プレビュー画像を取得・表示
         if self._frame_index is None:
             configure_presence(self, self._blank_text)
         elif isinstance(self._frame_index, int):
-            new_frame = self._video_model.get_frame(
-                ImageLayer.PREVIEW, self._frame_index
-            )
+            new_frame = video_model.get_frame(ImageLayer.PREVIEW, self._frame_index)
             if new_frame != self._current_frame:
                 if isinstance(new_frame, AISImage):
                     configure_presence(self, new_frame.photo_image)
@@ -129,7 +136,7 @@ class VideoLabel(ctk.CTkLabel):
             raise TypeError(f"Invalid Type {self._frame_index}")
 
         # 次の更新処理をキック
-        self.after(self._video_model.duration_in_msec, self._next_frame_handler)
+        self.after(video_model.duration_in_msec, self._next_frame_handler)
 
     def _on_resize(self, _):
         """
@@ -12,7 +12,8 @@ import warnings
 from pathlib import Path
 import os
 import traceback
-import inspect
+import codecs
+import functools
 import msvcrt
 
 # tk
@@ -26,17 +27,84 @@ import aynime_capture as ayc
 from utils.constants import LOG_DIR_PATH
 
 
+# 警告メッセージを１行にまとめるための変換テーブル
+_WARNINGS_NEWLINE_TABLE = str.maketrans({"\r": " ", "\n": " "})
+
+
+@functools.lru_cache(maxsize=256)
+def _warnings_basename(filename: str) -> str:
+    """
+    警告の発生元ファイル名を取得する
+    警告の発生元は限られたファイルなので、結果をキャッシュする
+    """
+    return os.path.basename(filename)
+
+
 def _warnings_custom_formatter(message, category, filename, lineno, line=None):
     """
     warnings モジュール用カスタムフォーマッタ
     vscode の Log モードに合わせたフォーマット
     そのうえで１行にまとめている
     """
-    base = os.path.basename(filename)
-    text = str(message).replace("\r", " ").replace("\n", " ").strip()
+    base = _warnings_basename(filename)
+    text = str(message).translate(_WARNINGS_NEWLINE_TABLE).strip()
     return f"{base}:{lineno}: {category.__name__}: {text}"
 
 
+class _ExcludeTeeFilter(logging.Filter):
+    """
+    stdout, stderr から流れてきたログを除外するフィルタ
+    コンソールへの二重出力を防ぐためのもの
+    """
+
+    # 除外対象のロガー名
+    _EXCLUDE_NAMES = frozenset(("stdout", "stderr"))
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        True なら出力対象
+        """
+        return record.name not in self._EXCLUDE_NAMES
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    asctime の文字列化結果をキャッシュするフォーマッタ
+    datefmt は秒単位までしか含まない前提で、同じ秒のレコードでは strftime を呼び直さない。
+    """
+
+    def __init__(self, fmt: str, datefmt: str):
+        """
+        コンストラクタ
+        """
+        super().__init__(fmt=fmt, datefmt=datefmt)
+
+        # (秒, 文字列化結果)
+        # NOTE
+        #   複数のハンドラ（＝別スレッド）から共有されるので、１つのタプルで丸ごと差し替える
+        self._last_time: tuple[int, str] | None = None
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """
+        record の時刻を文字列化する
+        """
+        created_sec = int(record.created)
+        last_time = self._last_time
+        if last_time is not None and last_time[0] == created_sec:
+            return last_time[1]
+        time_str = super().formatTime(record, datefmt)
+        self._last_time = (created_sec, time_str)
+        return time_str
+
+
+def _rotation_namer(name: str) -> str:
+    """
+    ローテーション後のログファイル名を決める
+    latest.log.YYYY-MM-DD → YYYY-MM-DD.log
+    """
+    return name.replace("latest.log.", "") + ".log"
+
+
 def _get_actual_stream(
     stream: io.TextIOWrapper | None = None,
 ) -> io.TextIOWrapper | None:
@@ -66,7 +134,7 @@ class _LoggingTee(io.TextIOBase):
         # 引数を保存
         self._dest_logger = dest_logger
         self._log_level = log_level
-        self._buffer: str = ""
+        self._buffer_parts: list[str] = []
         self._mirror_stream = mirror_stream
 
     def writable(self) -> bool:
@@ -79,23 +147,33 @@ class _LoggingTee(io.TextIOBase):
         """
         書き込み
         """
+        # 改行の有無を判定
+        # NOTE
+        #   改行の有無は今回の断片だけを見れば分かる。
+        text = s if isinstance(s, str) else str(s)
+        has_newline = "\n" in text
+
         # 先にコンソールに流す
+        # NOTE
+        #   フラッシュは行が完成した時だけで十分
         if self._mirror_stream is not None:
             try:
                 self._mirror_stream.write(s)
-                self._mirror_stream.flush()
+                if has_newline:
+                    self._mirror_stream.flush()
             except Exception:
                 pass
 
         # 改行単位でロガーに流す
-        self._buffer += s if isinstance(s, str) else str(s)
-        while True:
-            nl_idx = self._buffer.find("\n")
-            if nl_idx < 0:
-                break
-            line = self._buffer[:nl_idx]
-            self._buffer = self._buffer[nl_idx + 1 :]
-            self._dest_logger.log(self._log_level, line)
+        # NOTE
+        #   改行が来るまでは断片をリストに溜めるだけにして、文字列の連結・走査は改行が来た時に１回だけ行う。
+        self._buffer_parts.append(text)
+        if has_newline:
+            lines = "".join(self._buffer_parts).split("\n")
+            tail = lines.pop()
+            self._buffer_parts = [tail] if tail else []
+            for line in lines:
+                self._dest_logger.log(self._log_level, line)
 
         # 文字数を返す
         return len(s)
@@ -113,9 +191,9 @@ class _LoggingTee(io.TextIOBase):
                 pass
 
         # ロガー
-        if self._buffer:
-            self._dest_logger.log(self._log_level, self._buffer)
-            self._buffer = ""
+        if self._buffer_parts:
+            self._dest_logger.log(self._log_level, "".join(self._buffer_parts))
+            self._buffer_parts = []
 
 
 def _uncaught_exception_hook(exc_type, exc, tb):
@@ -198,9 +276,34 @@ def _pipe_forwarder(read_pipe_fd: int):
     """
     read_pipe_fd から logging へ文字列を転送する
     """
-    with os.fdopen(read_pipe_fd, "rb", closefd=True) as raw:
-        for line in io.TextIOWrapper(raw, encoding="utf-8", errors="replace"):
-            logging.getLogger("aynime_capture").info(line.rstrip("\r\n"))
+    # 定数
+    READ_SIZE = 65536
+
+    # エイリアス
+    logger = logging.getLogger("aynime_capture")
+
+    # パイプが閉じられるまで転送
+    # NOTE
+    #   行単位で読むと１行ごとに Python 側のバッファリングとデコードが走るので、まとめて読んでから行に分割する。
+    #   マルチバイト文字が読み込みの境界で分断されうるので、インクリメンタルデコーダを使う。
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    tail = ""
+    try:
+        while True:
+            chunk = os.read(read_pipe_fd, READ_SIZE)
+            if not chunk:
+                break
+            lines = (tail + decoder.decode(chunk)).split("\n")
+            tail = lines.pop()
+            for line in lines:
+                logger.info(line.rstrip("\r"))
+    finally:
+        os.close(read_pipe_fd)
+
+    # 改行で終わっていない残りを吐き出す
+    tail += decoder.decode(b"", final=True)
+    if tail:
+        logger.info(tail.rstrip("\r"))
 
 
 def setup_logging():
@@ -227,7 +330,7 @@ def setup_logging():
     root_logger.setLevel(LOGGING_VISIBLE_LEVEL)
 
     # フォーマットを生成
-    formatter = logging.Formatter(
+    formatter = _CachedTimeFormatter(
         fmt="%(asctime)s.%(msecs)03d [%(levelname)-5s] %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
@@ -246,7 +349,7 @@ def setup_logging():
     )
     rotation_file_handler.setFormatter(formatter)
     rotation_file_handler.setLevel(LOGGING_VISIBLE_LEVEL)
-    rotation_file_handler.namer = lambda name: name.replace("latest.log.", "") + ".log"
+    rotation_file_handler.namer = _rotation_namer
     root_logger.addHandler(rotation_file_handler)
 
     # 実際の stdout, stderr を解決
@@ -262,8 +365,10 @@ def setup_logging():
         stream_handler = logging.StreamHandler(actual_stdout or actual_stderr)
         stream_handler.setFormatter(formatter)
         stream_handler.setLevel(LOGGING_VISIBLE_LEVEL)
-        stream_handler.addFilter(lambda record: record.name not in ("stdout", "stderr"))
+        stream_handler.addFilter(_ExcludeTeeFilter())
         root_logger.addHandler(stream_handler)
+    else:
+        stream_handler = None
 
     # 未補足例外のフックを設定
     sys.excepthook = _uncaught_exception_hook
@@ -274,6 +379,14 @@ def setup_logging():
         pass
 
     # aynime_capture ロギング設定
+    # NOTE
+    #   aynime_capture のログは量が多くなりがちなので、ルートロガーを経由させずに直接ハンドラに流す。
+    #   出力先はルートロガーと同じ。
+    ayc_logger = logging.getLogger("aynime_capture")
+    ayc_logger.propagate = False
+    ayc_logger.addHandler(rotation_file_handler)
+    if stream_handler is not None:
+        ayc_logger.addHandler(stream_handler)
     read_pipe_fd, write_pipe_fd = os.pipe()
     ayc.set_log_handle(msvcrt.get_osfhandle(write_pipe_fd))
     threading.Thread(target=_pipe_forwarder, args=(read_pipe_fd,), daemon=True).start()
@@ -309,31 +422,31 @@ def infer_log_category(num_frame_skip: int) -> str:
     """
     # モジュール名・クラス名・関数名…列挙する
     parts: list[str] = []
-    frame = inspect.currentframe()
-    try:
-        # skip 層上のフレームへ巻き戻す
-        # NOTE
-        #   +1 はこの関数自身なので強制スキップ
-        for _ in range(num_frame_skip + 1):
-            if frame is None:
-                break
-            else:
-                frame = frame.f_back
 
-        # 巻き戻して最後まで行っちゃったら unknown で終了
-        if frame is None:
-            return "unknown"
+    # skip 層上のフレームへ巻き戻す
+    # NOTE
+    #   +1 はこの関数自身なので強制スキップ
+    #   f_back を１つずつ辿らずに、目的のフレームを直接取る
+    #   巻き戻して最後まで行っちゃったら unknown で終了
+    try:
+        frame = sys._getframe(num_frame_skip + 1)
+    except ValueError:
+        return "unknown"
 
+    try:
         # モジュール名
         # NOTE
         #   __main__ が来た場合はそのままスルー
         parts.append(frame.f_globals.get("__name__", "unknown"))
 
         # クラス名
-        if "self" in frame.f_locals:
-            parts.append(frame.f_locals["self"].__class__.__name__)
-        elif "cls" in frame.f_locals and isinstance(frame.f_locals["cls"], type):
-            parts.append(frame.f_locals["cls"].__name__)
+        # NOTE
+        #   f_locals はアクセスの度に生成されるので、１回だけ取る
+        f_locals = frame.f_locals
+        if "self" in f_locals:
+            parts.append(f_locals["self"].__class__.__name__)
+        elif "cls" in f_locals and isinstance(f_locals["cls"], type):
+            parts.append(f_locals["cls"].__name__)
 
         # 関数名
         func = frame.f_code.co_name
@@ -351,22 +464,17 @@ def infer_log_file_line(num_frame_skip: int) -> str | None:
     """
     ログで表示するファイル名・行数文字列をスタックトレースから自動推定
     """
-    # モジュール名・クラス名・関数名…列挙する
-    frame = inspect.currentframe()
+    # skip 層上のフレームへ巻き戻す
+    # NOTE
+    #   +1 はこの関数自身なので強制スキップ
+    #   f_back を１つずつ辿らずに、目的のフレームを直接取る
+    #   巻き戻して最後まで行っちゃったら None で終了
     try:
-        # skip 層上のフレームへ巻き戻す
-        # NOTE
-        #   +1 はこの関数自身なので強制スキップ
-        for _ in range(num_frame_skip + 1):
-            if frame is None:
-                break
-            else:
-                frame = frame.f_back
-
-        # 巻き戻して最後まで行っちゃったら None で終了
-        if frame is None:
-            return None
+        frame = sys._getframe(num_frame_skip + 1)
+    except ValueError:
+        return None
 
+    try:
         # 文字列化して返す
         return f""""{frame.f_globals["__file__"]}", line {frame.f_lineno}"""
     finally:
@@ -376,6 +484,14 @@ def infer_log_file_line(num_frame_skip: int) -> str | None:
 
 LogLevel = Literal["info", "warning", "error", "critical"]
 
+# LogLevel → logging のログレベル値
+_LOG_LEVEL_MAP: dict[str, int] = {
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
 
 def write_log(
     level: LogLevel,
@@ -396,6 +512,15 @@ def write_log(
     show_location:
         True なら、この関数を呼び出した位置（ファイル名、行数）をできるだけ表示する。
     """
+    # ログレベルを解決
+    # NOTE 未知のレベルは critical 扱い
+    log_level = _LOG_LEVEL_MAP.get(level, logging.CRITICAL)
+
+    # 出力されないレベルなら、表示文字列を組み立てる必要もない
+    logger = logging.getLogger()
+    if not logger.isEnabledFor(log_level):
+        return
+
     # 表示文字列を解決
     need_location = level in {"error", "critical"} or show_location
     if "\n" not in message and exception is None and not need_location:
@@ -423,19 +548,11 @@ def write_log(
         # NOTE
         #   このログの２行目以降に空白４文字のインデントで表示する
         if "\n" in fmt_str:
-            fmt_str = "▼\n" + "\n".join("    " + l for l in fmt_str.split("\n"))
+            fmt_str = "▼\n    " + fmt_str.replace("\n", "\n    ")
 
-    # ログレベルで呼び分け
-    logger = logging.getLogger()
-    if level == "info":
-        logger.info(fmt_str)
-    elif level == "warning":
-        logger.warning(fmt_str)
-    elif level == "error":
-        logger.error(fmt_str)
-    else:  # critical
-        # NOTE 異常系で呼ばれる可能性があるので、例外は投げない
-        logger.critical(fmt_str)
+    # ログに流す
+    # NOTE 異常系で呼ばれる可能性があるので、例外は投げない
+    logger.log(log_level, fmt_str)
 
 
 class PerfLogger:
@@ -1,5 +1,5 @@
 # std
-from time import sleep
+from time import sleep, perf_counter
 
 # utils
 from utils.constants import CAPTURE_FRAME_BUFFER_DURATION_IN_SEC
@@ -19,6 +19,14 @@ class CaptureStream:
     アプリケーションから使いやすいようにキャプチャ機能がまとめられたクラス。
     """
 
+    # スチルキャプチャのリトライ設定
+    # NOTE
+    #   有効なフレームが来るまで繰り返しリトライする
+    #   フレームはすぐに届くことが多いので、待ち時間は短く始めて倍々で伸ばす
+    STILL_TRY_LIMIT_IN_SEC = 2.0
+    STILL_MIN_RETRY_INTERVAL_IN_SEC = 0.001
+    STILL_MAX_RETRY_INTERVAL_IN_SEC = 0.1
+
     def __init__(self):
         """
         コンストラクタ
@@ -159,27 +167,28 @@ class CaptureStream:
 
         # キャプチャ
         # NOTE
-        #   有効なフレームが来るまで繰り返しリトライする
-        TRY_LIMIT_IN_SEC = 2.0
-        TRY_COUNT = 20
-        width, height, frame_bytes = (None, None, None)
-        for _ in range(TRY_COUNT + 1):
-            width, height, frame_bytes = self._session.GetFrameByTime(
-                relative_time_in_sec
-            )
+        #   有効なフレームが取れたらループ内で直接返す。
+        #   ループを抜けるのはタイムアウト時だけなので、事後の None チェックは不要。
+        session = self._session
+        deadline = perf_counter() + CaptureStream.STILL_TRY_LIMIT_IN_SEC
+        retry_interval = CaptureStream.STILL_MIN_RETRY_INTERVAL_IN_SEC
+        while True:
+            width, height, frame_bytes = session.GetFrameByTime(relative_time_in_sec)
             if frame_bytes is not None:
+                # 正常終了
+                return AISImage.from_bytes(width, height, frame_bytes)
+            remaining = deadline - perf_counter()
+            if remaining <= 0.0:
                 break
-            else:
-                sleep(TRY_LIMIT_IN_SEC / TRY_COUNT)
-
-        # タイムアウト
-        if width is None or height is None or frame_bytes is None:
-            raise RuntimeError(
-                f"Failed to captures valid frame in {TRY_LIMIT_IN_SEC} sec"
+            sleep(min(retry_interval, remaining))
+            retry_interval = min(
+                2.0 * retry_interval, CaptureStream.STILL_MAX_RETRY_INTERVAL_IN_SEC
             )
 
-        # 正常終了
-        return AISImage.from_bytes(width, height, frame_bytes)
+        # タイムアウト
+        raise RuntimeError(
+            f"Failed to captures valid frame in {CaptureStream.STILL_TRY_LIMIT_IN_SEC} sec"
+        )
 
     def capture_video(
         self, fps: float | None = None, duration_in_sec: float | None = None
@@ -192,12 +201,13 @@ class CaptureStream:
             raise ValueError("Capture session not started")
 
         # 直近のスナップショットを取得
-        frames: list[AISImage] = []
+        # NOTE
+        #   フレーム数は事前に分かるので、内包表記でリストを一括生成する。
         with ayc.Snapshot(self._session, fps, duration_in_sec) as snapshot:
-            for frame_index in range(snapshot.size):
-                frame_args = snapshot.GetFrame(frame_index)
-                ais_image = AISImage.from_bytes(*frame_args)
-                frames.append(ais_image)
+            frames = [
+                AISImage.from_bytes(*snapshot.GetFrame(frame_index))
+                for frame_index in range(snapshot.size)
+            ]
 
         # 正常終了
         return frames
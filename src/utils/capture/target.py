@@ -1,7 +1,8 @@
 # std
 from typing import Generator
 from dataclasses import dataclass
-from copy import deepcopy
+from functools import lru_cache
+from time import monotonic
 import re
 
 # win32
@@ -12,40 +13,93 @@ from utils.std import replace_multi
 from utils.windows import is_cloaked, sanitize_text
 
 
-@dataclass
+# ２つ以上連続する空白
+_MULTI_SPACE_PATTERN = re.compile(r" {2,}")
+
+# Prime Video のタイトル前後に付く余計な文字列
+_PRIME_VIDEO_NOISE_PATTERN = re.compile(r"Amazon\.co\.jp |を観る Prime Video")
+
+# アニメ名抽出の対象となるアプリのウィンドウ名末尾
+_SUPPORTED_APP_SUFFIXES = ("Mozilla Firefox", "Google Chrome", " - Discord")
+
+# ウィンドウ列挙結果のキャッシュ
+# NOTE
+#   (列挙した時刻, 列挙結果) を保持する。
+#   ワーカースレッドからも呼ばれるので、タプル１つの差し替えで更新する。
+ENUMERATE_WINDOWS_CACHE_TTL_IN_SEC = 0.25
+_enumerate_windows_cache: tuple[float, list["WindowHandle"]] | None = None
+
+
+@dataclass(frozen=True, slots=True)
 class MonitorIdentifier:
     """
     モニター識別子を保持するクラス
+    NOTE
+        不変な値オブジェクトなので frozen + slots にしておく。
+        インスタンスが軽くなり、辞書のキーにも使える。
     """
 
     adapter_index: int  # グラボのインデックス
     output_index: int  # モニターのインデックス
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WindowHandle:
     """
     ウィンドウ識別子を保持するクラス
+    NOTE
+        列挙のたびにウィンドウ数分生成されるので、MonitorIdentifier と同じく frozen + slots
     """
 
     value: int
 
 
 def enumerate_windows() -> Generator[WindowHandle, None, None]:
+    """
+    キャプチャ対象になり得るウィンドウを列挙する。
+    NOTE
+        １回の列挙で全ウィンドウ分の Win32 API 呼び出しとタイトル加工が走る。
+        リストの再構築が短時間に連続することが多いので、結果を短時間だけ使い回す。
+    """
+    global _enumerate_windows_cache
+
+    # キャッシュが新しければ、それを返す
+    now = monotonic()
+    cache = _enumerate_windows_cache
+    if cache is not None and now - cache[0] < ENUMERATE_WINDOWS_CACHE_TTL_IN_SEC:
+        yield from cache[1]
+        return
+
+    # 列挙し直してキャッシュを更新
+    window_handles = list(_enumerate_windows_uncached())
+    _enumerate_windows_cache = (now, window_handles)
+    yield from window_handles
+
+
+def _enumerate_windows_uncached() -> Generator[WindowHandle, None, None]:
+    """
+    enumerate_windows のキャッシュ無し版
+    """
     # 全てのウィンドウハンドルを列挙
+    # NOTE
+    #   コールバックはウィンドウ数だけ呼ばれるので、append は束縛済みのものを使う。
+    #   明示的に True を返して列挙を継続させる。
+    #   不可視・無題のウィンドウが大半なので、安価な判定はコールバック内で済ませておく。
+    #   無題判定はタイトルをコピーしない GetWindowTextLength で行う。
     hwnds: list[int] = []
+    append_hwnd = hwnds.append
+    is_window_visible = win32gui.IsWindowVisible
+    get_window_text_length = win32gui.GetWindowTextLength
 
-    def enum_handler(hwnd: int, _):
-        hwnds.append(hwnd)
+    def enum_handler(hwnd: int, _) -> bool:
+        if is_window_visible(hwnd) and get_window_text_length(hwnd) > 0:
+            append_hwnd(hwnd)
+        return True
 
     win32gui.EnumWindows(enum_handler, None)
 
     # 合法なウィンドウを順番に返す
     for hwnd in hwnds:
-        # 不可視ウィンドウはスキップ
-        if not win32gui.IsWindowVisible(hwnd):
-            continue
-
         # 最小化されているウィンドウはスキップ
         if win32gui.IsIconic(hwnd):
             continue
@@ -87,25 +141,49 @@ def get_nime_window_text(window_handle: WindowHandle) -> tuple[str, bool]:
     if window_handle is None:
         return "", False
 
-    # ウィンドウ名を取得
-    text = win32gui.GetWindowText(window_handle.value)
+    # ウィンドウ名を取得・加工
+    return _process_window_text(win32gui.GetWindowText(window_handle.value))
+
+
+@lru_cache(maxsize=512)
+def _process_window_text(text: str) -> tuple[str, bool]:
+    """
+    get_nime_window_text の加工部分。
+    生のウィンドウ名 text を受け取って (加工された名前, えぃにめか？) を返す。
+    NOTE
+        同じウィンドウ名は列挙・キャプチャのたびに何度も加工されるので、結果をキャッシュする。
+        入力も出力も不変なので、キャッシュしても安全。
+    """
+    # タイトルを持たないウィンドウは多いので、無毒化の前に弾いておく
+    if len(text) == 0:
+        return "", False
+
+    # ウィンドウ名を無毒化
     text = sanitize_text(text)
     if len(text) == 0:
         return "", False
 
+    # 非対応アプリなら断念
+    # NOTE
+    #   列挙されるウィンドウの大半はここに該当する。
+    #   タプル版 endswith で、末尾の照合を１回の呼び出しで済ませる。
+    if not text.endswith(_SUPPORTED_APP_SUFFIXES):
+        return text, False
+
     # アプリの種類で分岐
     # NOTE
     #   ブラウザの場合はアニメ名が取れるので、末尾のアプリ名だけ取って続行。
     #   それ以外は断念
+    #   末尾に付いていることは確認済みなので、除去は removesuffix で済ませる。
     if text.endswith("Mozilla Firefox"):
-        text = text.replace(" - Mozilla Firefox", "")
+        text = text.removesuffix(" - Mozilla Firefox")
     elif text.endswith("Google Chrome"):
-        text = text.replace(" - Google Chrome", "")
+        text = text.removesuffix(" - Google Chrome")
     elif text.endswith(" - Discord"):
         # NOTE
         #   Discord の配信画面は、チャンネル名が返ってくる
         #   そこにえぃにめは無い
-        text = text.replace(" - Discord", "")
+        text = text.removesuffix(" - Discord")
         return text, False
     else:
         # それ以外の非対応アプリ
@@ -115,7 +193,6 @@ def get_nime_window_text(window_handle: WindowHandle) -> tuple[str, bool]:
     # NOTE
     #   アニメタイトルと話数は区別せずに１つの「アニメ名」とみなす。
     #   最終的にそれを見た人間が認識できれば何でも良いので、一閃流として区別する必要がない。
-    bc_pos = text.find("バンダイチャンネル")
     if text.endswith("dアニメストア"):
         if text.find("アニメ動画見放題") >= 0:
             # NOTE
@@ -127,23 +204,24 @@ def get_nime_window_text(window_handle: WindowHandle) -> tuple[str, bool]:
             #   dアニメストアは「<アニメ名> - <話数> - <話タイトル>」形式。
             #   <話タイトル> は冗長なので除外する。
             #   区切り文字「 - 」は贅沢なので空白１文字に短縮。
-            text = text.replace(" dアニメストア", "")
+            text = text.removesuffix(" dアニメストア")
             text = " ".join(text.split(" - ")[:2])
     elif text.endswith("AnimeFesta"):
         # NOTE
         #   AnimeFesta はアニメ名しか出てこないので、特別にすることも無い
-        text = text.replace("を見る AnimeFesta", "")
-    elif bc_pos != -1:
+        text = text.removesuffix("を見る AnimeFesta")
+    elif "バンダイチャンネル" in text:
         # NOTE
         #   バンダイチャンネルの場合、余計な文字がいっぱい付くので、それらをまとめてカット。
         #   また、微妙な区切り文字が残るのでそれもカット。
-        text = text[:bc_pos]
+        text = text.partition("バンダイチャンネル")[0]
         if text.endswith("- "):
             text = text[:-2]
     elif text.endswith("Prime Video"):
         # NOTE
         #   Amazon Prime Video の場合、前後に余計な文字が付くので、それらをカット。
-        text = replace_multi(text, ["Amazon.co.jp ", "を観る Prime Video"], "")
+        #   両方まとめて１パスでカットする。
+        text = _PRIME_VIDEO_NOISE_PATTERN.sub("", text)
     elif text.endswith("ABEMA"):
         # NOTE
         #   ABEMA の場合、シンプルにカットしていくだけで良い
@@ -154,8 +232,9 @@ def get_nime_window_text(window_handle: WindowHandle) -> tuple[str, bool]:
         return text, False
 
     # 余計な空白を除去
-    text = text.strip().rstrip()
-    text = re.sub(r" {2,}", " ", text)
+    text = text.strip()
+    if "  " in text:
+        text = _MULTI_SPACE_PATTERN.sub(" ", text)
 
     # 正常終了
     return text, True
@@ -1,6 +1,7 @@
 # std
-import warnings
 from typing import Callable, Literal
+from functools import cache
+import warnings
 
 # PIL
 from PIL.ImageTk import PhotoImage
@@ -15,20 +16,45 @@ from utils.constants import DEFAULT_FONT_FAMILY, APP_NAME_JP
 from utils.ais_logging import LogLevel, write_log
 
 
+# CTk の「画像が CTkImage ではない」旨の警告を抑制
+# NOTE
+#   silent_configure の契約を満たすためのフィルタなので、このモジュールの import 時に登録する。
+#   PhotoImage を直接ラベルに設定する都合上、この警告は設定の度に必ず出るので無視する。
+#   警告文の先頭はウィジェットのクラス名なので、派生クラスにもマッチするようにしておく。
+warnings.filterwarnings(
+    "ignore",
+    message=r"\w+ Warning: Given image is not CTkImage",
+    category=UserWarning,
+)
+
+
+@cache
+def get_default_font() -> ctk.CTkFont:
+    """
+    全ウィジェットで共有するデフォルトフォントを取得する。
+    NOTE
+        CTkFont の生成は Tk 側のフォント確保を伴うので、インスタンス毎には作らない。
+        Tk ルートが存在しないと生成できないので、初回の呼び出しまで生成を遅延する。
+    """
+    return ctk.CTkFont(DEFAULT_FONT_FAMILY)
+
+
 def silent_configure(widget: ctk.CTkBaseClass, **kwargs):
     """
     widget に対して configure を呼び出して **kwargs を渡す。
-    ただし configure 内で発生した警告は抑制される。
+    ただし「画像が CTkImage ではない」旨の警告は抑制される。
+    NOTE
+        警告の抑制は、このモジュールの import 時に登録するフィルタで行う。
+        catch_warnings は呼び出しの度に warnings のグローバル状態を退避・復元するので、ここでは使わない。
     """
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore", UserWarning)
-        widget.configure(**kwargs)
+    widget.configure(**kwargs)
 
 
 def configure_presence(widget: ctk.CTkBaseClass, content: PhotoImage | str):
     """
     widget に対して configure を呼び出して content を設定する。
-    ただし configure 内で発生した警告は抑制される。
+    PhotoImage を渡した時に出る「Given image is not CTkImage」の UserWarning は、
+    このモジュールの import 時に登録したフィルタで抑制される（それ以外の警告は抑制しない）。
     """
     if isinstance(content, PhotoImage):
         silent_configure(widget, image=content, text="")
@@ -392,6 +392,10 @@ class AISImage:
     PIL.Image.Image が使いづらすぎなので、その代替となる画像クラス。
     """
 
+    # NOTE
+    #   フレーム・レイヤー毎にインスタンスが生成されるので、 __dict__ を持たせない
+    __slots__ = ("_pil_image", "_photo_image")
+
     def __init__(self, source: Image.Image):
         """
         コンストラクタ
@@ -465,7 +469,11 @@ class AISImage:
         else:
             raise TypeError(f"Invalid type {type(other)}")
 
-    def resize_contain(self, resize_desc: ResizeDesc) -> "AISImage":
+    def resize_contain(
+        self,
+        resize_desc: ResizeDesc,
+        resample: Image.Resampling = Image.Resampling.LANCZOS,
+    ) -> "AISImage":
         """
         (width, height) のボックス内に image 全体が収まるようにリサイズする。
         リサイズ前後でアスペクト比は維持される。
@@ -474,6 +482,7 @@ class AISImage:
         Args:
             target_width (int): リサイズ後のサイズ（横）
             target_height (int): リサイズ後のサイズ（縦）
+            resample (Image.Resampling): リサンプリングフィルタ
 
         Returns:
             AISImage: リサイズ後の画像
@@ -499,20 +508,26 @@ class AISImage:
             actual_width = round(image.width * target_height / image.height)
             actual_height = target_height
 
-        # スケール不要ならコピーを返す
+        # スケール不要なら自身をそのまま返す
+        # NOTE
+        #   AISImage の中身に対する in-place 処理は禁止なので、コピーを取る必要はない
         if actual_width == image.width and actual_height == image.height:
-            return AISImage(image.copy())
+            return self
 
         # リサイズして返す
         return AISImage(
             image.resize(
                 (actual_width, actual_height),
-                Image.Resampling.LANCZOS,
+                resample,
                 reducing_gap=2.0,
             )
         )
 
-    def resize_cover(self, resize_desc: ResizeDesc) -> "AISImage":
+    def resize_cover(
+        self,
+        resize_desc: ResizeDesc,
+        resample: Image.Resampling = Image.Resampling.LANCZOS,
+    ) -> "AISImage":
         """
         self の範囲内に (width, height) のボックスがちょうど収まるように self をリサイズする。
         リサイズ前後でアスペクト比は維持される。
@@ -522,6 +537,7 @@ class AISImage:
         Args:
             target_width (int): リサイズ後のサイズ（横）
             target_height (int): リサイズ後のサイズ（縦）
+            resample (Image.Resampling): リサンプリングフィルタ
 
         Returns:
             AISImage: リサイズ後の画像
@@ -553,7 +569,7 @@ class AISImage:
         else:
             scaled_image = image.resize(
                 (pre_crop_width, pre_crop_height),
-                Image.Resampling.LANCZOS,
+                resample,
                 reducing_gap=2.0,
             )
 
@@ -570,7 +586,12 @@ class AISImage:
         # 正常終了
         return AISImage(croped_image)
 
-    def resize(self, resize_desc: ResizeDesc, mode: ResizeMode) -> "AISImage":
+    def resize(
+        self,
+        resize_desc: ResizeDesc,
+        mode: ResizeMode,
+        resample: Image.Resampling = Image.Resampling.LANCZOS,
+    ) -> "AISImage":
         """
         image を target_size にリサイズする
         リサイズの挙動は mode に従う
@@ -578,14 +599,15 @@ class AISImage:
         Args:
             target_size (Union[SizePixel, SizePattern]): リサイズ先サイズ
             mode (ResizeMode): リサイズ挙動
+            resample (Image.Resampling): リサンプリングフィルタ
 
         Returns:
             AISImage: リサイズ済み画像
         """
         if mode == ResizeMode.CONTAIN:
-            return self.resize_contain(resize_desc)
+            return self.resize_contain(resize_desc, resample)
         elif mode == ResizeMode.COVER:
-            return self.resize_cover(resize_desc)
+            return self.resize_cover(resize_desc, resample)
         else:
             raise ValueError(mode)
 
@@ -597,16 +619,11 @@ class AISImage:
         return AISImage(self._pil_image.convert("L"))
 
 
-def calc_ssim(image_A: AISImage, image_B: AISImage) -> float:
+def _to_ssim_operands(
+    image_A: AISImage, image_B: AISImage
+) -> tuple[np.ndarray, np.ndarray]:
     """
-    ２枚の画像の差分を撮って、１ピクセルあたりの輝度誤差を計算する
-
-    Args:
-        image_A (AISImage): 比較対象 A
-        image_B (AISImage): 比較対象 B
-
-    Returns:
-        float: 平均ピクセル誤差
+    SSIM 系の計算に渡す、同サイズのグレースケール ndarray ２枚を生成する
     """
     # 画像にサイズ差がある場合は小さい方に合わせる
     if image_A.width != image_B.width or image_A.height != image_B.height:
@@ -629,6 +646,24 @@ def calc_ssim(image_A: AISImage, image_B: AISImage) -> float:
     np_image_A = np.array(image_A.grayscale.pil_image)
     np_image_B = np.array(image_B.grayscale.pil_image)
 
+    # 正常終了
+    return np_image_A, np_image_B
+
+
+def calc_ssim(image_A: AISImage, image_B: AISImage) -> float:
+    """
+    ２枚の画像の差分を撮って、１ピクセルあたりの輝度誤差を計算する
+
+    Args:
+        image_A (AISImage): 比較対象 A
+        image_B (AISImage): 比較対象 B
+
+    Returns:
+        float: 平均ピクセル誤差
+    """
+    # ndarray 化
+    np_image_A, np_image_B = _to_ssim_operands(image_A, image_B)
+
     # ssim の計算処理を呼び出す
     ssim_result = ssim(np_image_A, np_image_B, full=True)
 
@@ -642,6 +677,79 @@ def calc_ssim(image_A: AISImage, image_B: AISImage) -> float:
     return score
 
 
+# SSIM 上界による事前判定の設定値
+# NOTE
+#   calc_ssim が使う skimage の structural_similarity の既定値（7x7 の一様窓・ uint8 の値域 255 ・ K1=0.01）に合わせる。
+#   上界と SSIM 本体は計算順序が違うので、浮動小数の誤差分だけ SSIM_UPPER_BOUND_MARGIN で安全側に倒す。
+SSIM_WINDOW_SIZE = 7
+SSIM_C1 = (0.01 * 255) ** 2
+SSIM_UPPER_BOUND_MARGIN = 1e-6
+
+
+def calc_ssim_upper_bound(image_A: AISImage, image_B: AISImage) -> float:
+    """
+    ２枚の画像の SSIM（ calc_ssim の値）の上界を安価に計算する
+
+    Args:
+        image_A (AISImage): 比較対象 A
+        image_B (AISImage): 比較対象 B
+
+    Returns:
+        float: SSIM の上界
+    """
+    # NOTE
+    #   窓毎の SSIM は輝度項 l = (2μaμb + C1) / (μa² + μb² + C1) と
+    #   コントラスト・構造項 cs = (2σab + C2) / (σa² + σb² + C2) の積で、
+    #   コーシー・シュワルツより cs <= 1 、かつ l > 0 なので、窓毎に SSIM <= l が成り立つ。
+    #   SSIM は窓毎の値の平均なので、 l の平均は SSIM の上界になる。
+    #   l は窓平均だけで決まるので、積分画像から分散を求めずに計算できる。
+    np_image_A, np_image_B = _to_ssim_operands(image_A, image_B)
+
+    # 窓が取れないほど小さい画像は判定しない
+    height, width = np_image_A.shape
+    if height < SSIM_WINDOW_SIZE or width < SSIM_WINDOW_SIZE:
+        return 1.0
+
+    # 窓平均を積分画像から求める
+    # NOTE
+    #   structural_similarity は画像の端から (窓サイズ - 1) / 2 だけ内側の窓で平均を取るので、
+    #   画像からはみ出さない窓だけを対象にすれば一致する。
+    def window_mean(np_image: np.ndarray) -> np.ndarray:
+        integral = np.zeros((height + 1, width + 1), dtype=np.int64)
+        np.cumsum(
+            np.cumsum(np_image, axis=0, dtype=np.int64), axis=1, out=integral[1:, 1:]
+        )
+        k = SSIM_WINDOW_SIZE
+        window_sum = (
+            integral[k:, k:]
+            - integral[:-k, k:]
+            - integral[k:, :-k]
+            + integral[:-k, :-k]
+        )
+        return window_sum / (k * k)
+
+    mean_A = window_mean(np_image_A)
+    mean_B = window_mean(np_image_B)
+
+    # 輝度項の平均を計算
+    luminance = (2 * mean_A * mean_B + SSIM_C1) / (mean_A**2 + mean_B**2 + SSIM_C1)
+
+    # 正常終了
+    return float(luminance.mean())
+
+
+def is_obviously_dissimilar(
+    image_A: AISImage, image_B: AISImage, ssim_threshold: float
+) -> bool:
+    """
+    SSIM の上界だけを見て、２枚の画像の SSIM が ssim_threshold を超えないことが明らかなら True
+    calc_ssim の前段で安価に足切りするためのもの。
+    上界による判定なので、 True を返したペアで calc_ssim が ssim_threshold を超えることは無い。
+    """
+    upper_bound = calc_ssim_upper_bound(image_A, image_B)
+    return upper_bound <= ssim_threshold - SSIM_UPPER_BOUND_MARGIN
+
+
 def is_video_file(file_path: Path) -> bool:
     """
     file_path がビデオなら True を返す
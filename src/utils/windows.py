@@ -196,49 +196,83 @@ def is_cloaked(hwnd: int) -> bool:
     return res == 0 and cloaked.value != 0
 
 
-def sanitize_text(text: str) -> str:
+def _build_sanitize_table() -> dict[int, str | None]:
     """
-    text を「無毒化」する
-    無毒化されたテキストは、ファイル名に含めることができる。
+    sanitize_text で使う１文字単位の置換テーブルを構築する
     """
-    # Windows パス的な禁止文字を削除
-    text = re.sub(r'[<>:"/\\|?*\x00-\x1F]', "　", text)
+    table: dict[int, str | None] = dict()
+
+    # Windows パス的な禁止文字 --> 半角空白
+    # NOTE
+    #   ASCII の | もここに含まれるので、区切り文字としては扱われない
+    for ch in '<>:"/\\|?*':
+        table[ord(ch)] = " "
+    for code in range(0x00, 0x20):
+        table[code] = " "
 
-    # 見た目空白な文字を ASCII 半角スペースに統一
+    # 見た目空白な文字 --> 半角空白
     # NOTE
     #   NBSP, 全角, 2000-系, 202F, 205F, 1680
-    text = re.sub(r"[\u00A0\u1680\u2000-\u200A\u202F\u205F\u3000]", " ", text)
+    for code in (0x00A0, 0x1680, 0x202F, 0x205F, 0x3000):
+        table[code] = " "
+    for code in range(0x2000, 0x200B):
+        table[code] = " "
 
-    # ゼロ幅系を削除
+    # ゼロ幅系 --> 削除
     # NOTE
     #   ZWSP/ZWNJ/ZWJ/WORD JOINER/BOM
     #   歴史的に空白扱いの MVS
-    text = re.sub(r"[\u200B-\u200D\u2060\uFEFF\u180E]", "", text)
+    for code in (0x200B, 0x200C, 0x200D, 0x2060, 0xFEFF, 0x180E):
+        table[code] = None
 
-    # ソフトハイフンを削除
+    # ソフトハイフン --> 削除
     # NOTE
     #   通常は印字されず「改行位置の候補」だけを意味する。
     #   可視の意図はないので 削除。
-    text = re.sub(r"\u00AD", "", text)
+    table[0x00AD] = None
 
-    # 区切り文字を ASCII のハイフンで統一
+    # 区切り文字 --> ASCII のハイフン
     # NOTE
     #   \u2013 = en dash
     #   \u2014 = em dash
     #   \u2015 = horizontal bar
-    #   \u007C = vertical bar (ASCII |)
     #   \uFF5C = fullwidth vertical bar
     #   \u2011 = non-breaking hyphen
-    text = re.sub(r"[\u2013\u2014\u2015\u007C\uFF5C\u2011]", "-", text)
+    for code in (0x2013, 0x2014, 0x2015, 0xFF5C, 0x2011):
+        table[code] = "-"
 
     # アンダースコア --> 半角空白
-    text = text.replace("_", " ")
+    table[ord("_")] = " "
+
+    # 正常終了
+    return table
+
+
+# sanitize_text 用のテーブル・パターン
+# NOTE
+#   ウィンドウ列挙のたびに全ウィンドウ分呼ばれるので、import 時に一度だけ構築しておく
+_SANITIZE_TABLE = _build_sanitize_table()
+_SANITIZE_MULTI_SPACE_PATTERN = re.compile(r" {2,}")
+
+
+def sanitize_text(text: str) -> str:
+    """
+    text を「無毒化」する
+    無毒化されたテキストは、ファイル名に含めることができる。
+    """
+    # 禁止文字・空白系・ゼロ幅系・区切り文字などを一括で置換・削除
+    # NOTE
+    #   どれも１文字単位の置換なので、str.translate の１パスにまとめている
+    text = text.translate(_SANITIZE_TABLE)
 
     # ２つ以上連続する空白を 1 文字に短縮
-    text = re.sub(r" {2,}", " ", text)
+    # NOTE
+    #   大半のタイトルには連続空白が無いので、その場合は正規表現を走らせない
+    if "  " in text:
+        text = _SANITIZE_MULTI_SPACE_PATTERN.sub(" ", text)
 
     # 前後の空白系文字を削除
-    text = text.strip().rstrip()
+    text = text.strip()
 
     # 正常終了
     return text